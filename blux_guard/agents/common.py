@@ -12,13 +12,13 @@ class Agent(Protocol):
         ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class AgentInfo:
     name: str
     platform: str
 
 
-def detect_agent() -> AgentInfo:
+def _detect_platform() -> AgentInfo:
     system = platform.system().lower()
     if "linux" in system:
         name = "linux"
@@ -29,3 +29,11 @@ def detect_agent() -> AgentInfo:
     else:
         name = "termux" if "android" in system else "unknown"
     return AgentInfo(name=name, platform=system)
+
+
+# The host platform cannot change while the process runs, so resolve it once.
+_AGENT_INFO = _detect_platform()
+
+
+def detect_agent() -> AgentInfo:
+    return _AGENT_INFO
@@ -14,7 +14,8 @@ from .core import telemetry
 def generate_correlation_id() -> str:
     """Return a correlation id (UUID4) with optional override from env."""
 
-    return os.environ.get("BLUX_GUARD_CORRELATION_ID", str(uuid.uuid4()))
+    override = os.environ.get("BLUX_GUARD_CORRELATION_ID")
+    return override if override is not None else str(uuid.uuid4())
 
 
 def audit_log_path() -> Path:
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 import uuid
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-
-from jsonschema import Draft202012Validator
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
 
 from blux_guard import audit
 
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+
 GUARD_RECEIPT_SCHEMA_ID = "blux://contracts/guard_receipt.schema.json"
 _CONTRACTS_ROOT = Path(__file__).resolve().parents[2] / "contracts" / "phase0"
 
@@ -22,9 +25,16 @@ def _load_schema(schema_name: str) -> Dict[str, Any]:
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
+@cache
+def _schema_validator(schema_name: str) -> Draft202012Validator:
+    # jsonschema dominates package import time; load it on first validation.
+    from jsonschema import Draft202012Validator  # noqa: PLC0415
+
+    return Draft202012Validator(_load_schema(schema_name))
+
+
 def _validate_schema(payload: Dict[str, Any], schema_name: str) -> None:
-    schema = _load_schema(schema_name)
-    validator = Draft202012Validator(schema)
+    validator = _schema_validator(schema_name)
     errors = sorted(validator.iter_errors(payload), key=lambda err: err.path)
     if errors:
         messages = "; ".join(
@@ -55,7 +65,8 @@ def _resolve_environment(envelope: Dict[str, Any]) -> Dict[str, List[str]]:
 
 
 def _resolve_constraints(envelope: Dict[str, Any]) -> Dict[str, Any]:
-    working_dir = str(Path(envelope.get("working_dir", Path.cwd())))
+    working_dir = envelope.get("working_dir")
+    working_dir = os.getcwd() if working_dir is None else str(Path(working_dir))
     allowed_commands = envelope.get("allowed_commands")
     if allowed_commands is None:
         command = envelope.get("command")
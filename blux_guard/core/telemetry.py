@@ -53,6 +53,10 @@ def _ensure_dirs() -> bool:
     """Create the telemetry directory if possible."""
 
     try:
+        # Every recorded event lands here; a single stat avoids the failing
+        # mkdir() plus exception that ``exist_ok`` costs once the dir exists.
+        if _LOG_DIR.is_dir():
+            return True
         _LOG_DIR.mkdir(parents=True, exist_ok=True)
         return True
     except Exception as exc:  # pragma: no cover - defensive
@@ -90,15 +94,24 @@ def verbose_enabled() -> bool:
 
 def _safe_jsonl_write(path: Path, obj: Dict[str, Any]) -> None:
     try:
+        line = json.dumps(obj, ensure_ascii=False) + "\n"
         with _lock:
             with path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                handle.write(line)
     except Exception as exc:  # pragma: no cover - defensive
         _warn_once("json", f"jsonl write failed ({path}): {exc}")
 
 
 def _safe_sqlite_write(table: str, obj: Dict[str, Any]) -> None:
     try:
+        row = (
+            obj.get("ts"),
+            obj.get("level"),
+            obj.get("actor"),
+            obj.get("action"),
+            obj.get("stream"),
+            json.dumps(obj.get("payload", {}), ensure_ascii=False),
+        )
         with _lock:
             conn = sqlite3.connect(_DB)
             try:
@@ -119,14 +132,7 @@ def _safe_sqlite_write(table: str, obj: Dict[str, Any]) -> None:
                     INSERT INTO {table} (ts, level, actor, action, stream, payload)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        obj.get("ts"),
-                        obj.get("level"),
-                        obj.get("actor"),
-                        obj.get("action"),
-                        obj.get("stream"),
-                        json.dumps(obj.get("payload", {}), ensure_ascii=False),
-                    ),
+                    row,
                 )
                 conn.commit()
             finally:
@@ -170,9 +176,7 @@ def record_event(
         print(f"[telemetry] {preview}", file=sys.stderr)
 
 
-async def collect_status() -> Dict[str, Any]:
-    """Return a simplified status snapshot for guard reporting."""
-
+def _status_snapshot() -> Dict[str, Any]:
     ensure_log_dir()
     return {
         "log_dir": str(_LOG_DIR),
@@ -184,14 +188,16 @@ async def collect_status() -> Dict[str, Any]:
     }
 
 
+async def collect_status() -> Dict[str, Any]:
+    """Return a simplified status snapshot for guard reporting."""
+
+    return _status_snapshot()
+
+
 def collect_status_sync() -> Dict[str, Any]:
-    """Synchronous wrapper over :func:`collect_status`."""
+    """Return the status snapshot without an event loop; safe inside a running loop."""
 
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(collect_status())
-    finally:
-        loop.close()
+    return _status_snapshot()
 
 
 @dataclass
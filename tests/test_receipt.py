@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from blux_guard.core import receipt as receipt_engine
@@ -27,3 +30,31 @@ def test_mechanical_receipt_includes_constraints() -> None:
 def test_bindings_include_trace_id() -> None:
     receipt = receipt_engine.issue_guard_receipt(_base_envelope())
     assert receipt.bindings["trace_id"] == "trace-123"
+
+
+def test_schema_validator_is_built_once_per_schema() -> None:
+    receipt_engine._schema_validator.cache_clear()
+    first = receipt_engine._schema_validator("request_envelope.schema.json")
+    second = receipt_engine._schema_validator("request_envelope.schema.json")
+    assert first is second
+    assert receipt_engine._schema_validator.cache_info().hits == 1
+
+
+def test_working_dir_defaults_to_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    receipt = receipt_engine.issue_guard_receipt({"trace_id": "trace-456"})
+    assert receipt.constraints["working_dir"] == str(tmp_path)
+    assert receipt.constraints["allowed_paths"] == [str(tmp_path)]
+
+
+def test_package_import_does_not_load_jsonschema() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, blux_guard; assert 'jsonschema' not in sys.modules",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        check=False,
+    )
+    assert result.returncode == 0
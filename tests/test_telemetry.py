@@ -0,0 +1,30 @@
+"""Tests for best-effort telemetry sinks."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from blux_guard.core import telemetry
+
+
+def test_unusable_log_dir_degrades_without_raising(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_dir = tmp_path / ("x" * 300) / "logs"
+    monkeypatch.setattr(telemetry, "_LOG_DIR", log_dir)
+    monkeypatch.setattr(telemetry, "_JSONL", log_dir / "audit.jsonl")
+    monkeypatch.setattr(telemetry, "_DB", log_dir / "telemetry.db")
+    monkeypatch.setattr(
+        telemetry, "_warned_once", {"json": False, "sqlite": False, "dir": False}
+    )
+    monkeypatch.setenv("BLUX_GUARD_TELEMETRY_WARN", "once")
+
+    assert telemetry.ensure_log_dir() is False
+    assert telemetry._warned_once["dir"] is True
+    telemetry.record_event("test.degrade", payload={"ok": True})
+    assert telemetry.collect_status_sync()["log_dir"] == str(log_dir)